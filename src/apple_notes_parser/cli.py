@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import argparse
-import json
+import functools
+import operator
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -205,90 +206,15 @@ def cmd_export(args: argparse.Namespace) -> None:
         if args.tag:
             notes_to_export = [n for n in notes_to_export if n.has_tag(args.tag)]
 
-        # Create a filtered export
-        if len(notes_to_export) != len(parser.notes):
-            # Create custom export with filtered notes
-            export_data = {
-                "accounts": [
-                    {
-                        "id": account.id,
-                        "name": account.name,
-                        "identifier": account.identifier,
-                        "user_record_name": account.user_record_name,
-                    }
-                    for account in parser.accounts
-                ],
-                "folders": [
-                    {
-                        "id": folder.id,
-                        "name": folder.name,
-                        "account_name": folder.account.name,
-                        "uuid": folder.uuid,
-                        "parent_id": folder.parent_id,
-                        "path": folder.get_path(),
-                    }
-                    for folder in parser.folders
-                ],
-                "notes": [
-                    {
-                        "id": note.id,
-                        "note_id": note.note_id,
-                        "title": note.title,
-                        "content": note.content if args.include_content else None,
-                        "creation_date": note.creation_date.isoformat()
-                        if note.creation_date
-                        else None,
-                        "modification_date": note.modification_date.isoformat()
-                        if note.modification_date
-                        else None,
-                        "account_name": note.account.name,
-                        "folder_name": note.folder.name,
-                        "folder_path": note.get_folder_path(),
-                        "is_pinned": note.is_pinned,
-                        "is_password_protected": note.is_password_protected,
-                        "uuid": note.uuid,
-                        "applescript_id": note.applescript_id,
-                        "tags": note.tags,
-                        "mentions": note.mentions,
-                        "links": note.links,
-                        "attachments": [
-                            {
-                                "id": attachment.id,
-                                "filename": attachment.filename,
-                                "file_size": attachment.file_size,
-                                "type_uti": attachment.type_uti,
-                                "file_extension": attachment.file_extension,
-                                "mime_type": attachment.mime_type,
-                                "is_image": attachment.is_image,
-                                "is_video": attachment.is_video,
-                                "is_audio": attachment.is_audio,
-                                "is_document": attachment.is_document,
-                                "creation_date": attachment.creation_date.isoformat()
-                                if attachment.creation_date
-                                else None,
-                                "modification_date": attachment.modification_date.isoformat()
-                                if attachment.modification_date
-                                else None,
-                                "uuid": attachment.uuid,
-                                "is_remote": attachment.is_remote,
-                                "remote_url": attachment.remote_url,
-                            }
-                            for attachment in note.attachments
-                        ],
-                    }
-                    for note in notes_to_export
-                ],
-            }
-        else:
-            # Export all data
-            export_data = parser.export_notes_to_dict(
-                include_content=args.include_content
-            )
-
-        # Write to file
+        # Stream the export to file
         output_path = Path(args.output)
         with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False)
+            parser.export_notes_to_json(
+                f,
+                include_content=args.include_content,
+                notes=notes_to_export,
+                compact=args.compact,
+            )
 
         print(f"Exported {len(notes_to_export)} note(s) to {output_path}")
 
@@ -331,7 +257,7 @@ def cmd_stats(args: argparse.Namespace) -> None:
             if args.verbose:
                 print("   Top tags:")
                 sorted_tags = sorted(
-                    tag_counts.items(), key=lambda x: x[1], reverse=True
+                    tag_counts.items(), key=operator.itemgetter(1), reverse=True
                 )
                 for tag, count in sorted_tags[:10]:
                     print(f"      #{tag}: {count} notes")
@@ -523,7 +449,9 @@ def cmd_tags(args: argparse.Namespace) -> None:
 
         # Sort by count (descending) or alphabetically
         if args.sort_by_count:
-            sorted_tags = sorted(tag_counts.items(), key=lambda x: x[1], reverse=True)
+            sorted_tags = sorted(
+                tag_counts.items(), key=operator.itemgetter(1), reverse=True
+            )
         else:
             sorted_tags = sorted(tag_counts.items())
 
@@ -542,8 +470,12 @@ def cmd_tags(args: argparse.Namespace) -> None:
         handle_parser_error(e)
 
 
+@functools.lru_cache(maxsize=1)
 def create_parser() -> argparse.ArgumentParser:
-    """Create the argument parser."""
+    """Create the argument parser.
+
+    The parser tree is built once and reused; parsing does not mutate it.
+    """
     parser = argparse.ArgumentParser(
         prog="apple-notes-parser",
         description="Parse and analyze Apple Notes databases",
@@ -634,6 +566,11 @@ Examples:
         "--account", help="Export only notes from specific account"
     )
     export_parser.add_argument("--tag", help="Export only notes with specific tag")
+    export_parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Write compact JSON without indentation (faster, smaller files)",
+    )
     export_parser.set_defaults(func=cmd_export)
 
     # Stats command
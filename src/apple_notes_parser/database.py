@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import gzip
 import sqlite3
+import sys
 from datetime import datetime
 from pathlib import Path
 
@@ -18,17 +19,25 @@ CORE_DATA_EPOCH_OFFSET = (
 )
 MAX_TIMESTAMP_32BIT = 2147483647  # Maximum 32-bit timestamp value
 MAX_TIMESTAMP_YEAR_2100 = 4102444800  # Timestamp for year 2100 (reasonable upper bound)
+# Largest Core Data timestamp that passes both upper bounds above
+MAX_CORE_DATA_TIMESTAMP = min(
+    MAX_TIMESTAMP_32BIT, MAX_TIMESTAMP_YEAR_2100 - CORE_DATA_EPOCH_OFFSET
+)
 
 
 class AppleNotesDatabase:
     """Handles SQLite database operations for Apple Notes."""
 
-    def __init__(self, database_path: str | None = None):
+    def __init__(self, database_path: str | None = None, immutable: bool = False):
         """Initialize with path to Notes SQLite database.
 
         Args:
             database_path: Path to NoteStore.sqlite. If None, tries to find the default
                           macOS location in ~/Library/Group Containers/.
+            immutable: Open the file read-only with SQLite's ``immutable`` flag, which
+                      skips all locking and WAL handling. Only use this for copies
+                      that nothing else is writing to and whose WAL has been
+                      checkpointed, such as exported snapshots or test fixtures.
 
         Raises:
             DatabaseError: If the database file is not found.
@@ -40,6 +49,7 @@ class AppleNotesDatabase:
         if not self.database_path.exists():
             raise DatabaseError(f"Database file not found: {database_path}")
 
+        self.immutable = immutable
         self.connection: sqlite3.Connection | None = None
         self._macos_version: int | None = None
         self._embedded_extractor: EmbeddedObjectExtractor | None = None
@@ -123,13 +133,21 @@ class AppleNotesDatabase:
     def connect(self) -> None:
         """Connect to the SQLite database.
 
-        Establishes connection and initializes embedded object extractor.
+        Establishes a query-only connection and initializes embedded object
+        extractor. The Notes database uses WAL journaling, so readers never
+        block each other; query-only guarantees we never write to it. An
+        immutable database is opened through a read-only URI instead.
 
         Raises:
             DatabaseError: If connection to the database fails.
         """
         try:
-            self.connection = sqlite3.connect(str(self.database_path))
+            if self.immutable:
+                uri = f"{self.database_path.resolve().as_uri()}?mode=ro&immutable=1"
+                self.connection = sqlite3.connect(uri, uri=True)
+            else:
+                self.connection = sqlite3.connect(str(self.database_path))
+                self.connection.execute("PRAGMA query_only = ON")
             self.connection.row_factory = sqlite3.Row
 
             # Initialize embedded object extractor once we have connection and version
@@ -327,7 +345,8 @@ class AppleNotesDatabase:
                 if account_id in accounts:
                     folder = Folder(
                         id=row[0],
-                        name=row[1] or "Untitled Folder",
+                        # Interned: names are used as dict keys and compared often
+                        name=sys.intern(row[1] or "Untitled Folder"),
                         account=accounts[account_id],
                         uuid=row[3] if row[3] else None,
                         parent_id=row[4] if len(row) > 4 and row[4] else None,
@@ -424,7 +443,10 @@ class AppleNotesDatabase:
             raise DatabaseError(f"Failed to get attachments: {e}")
 
     def get_notes(
-        self, accounts: dict[int, Account], folders: dict[int, Folder]
+        self,
+        accounts: dict[int, Account],
+        folders: dict[int, Folder],
+        decode_embedded: bool = True,
     ) -> list[Note]:
         """Get all notes from the database.
 
@@ -437,6 +459,10 @@ class AppleNotesDatabase:
                      Only notes belonging to these accounts will be returned.
             folders: Dictionary mapping folder IDs to Folder objects.
                     Only notes in these folders will be returned.
+            decode_embedded: Whether to extract hashtags, mentions and links. When
+                            False, notes are returned with empty tags, mentions and
+                            links, skipping the embedded object lookups and the
+                            protobuf structure parse.
 
         Returns:
             list[Note]: List of Note objects representing all notes in the database.
@@ -502,29 +528,36 @@ class AppleNotesDatabase:
                 if account_id in accounts and folder_id in folders:
                     # Decompress and parse content using protobuf parser
                     content = ProtobufParser.extract_note_text(row[3])
-                    structure = ProtobufParser.parse_note_structure(row[3])
-
-                    # Extract embedded objects (hashtags, mentions, links) from database
-                    embedded_objects = (
-                        self._embedded_extractor.get_embedded_objects_for_note(row[1])
-                        if self._embedded_extractor
-                        else {}
-                    )
-
-                    # Combine hashtags from both protobuf content and embedded objects
-                    # Embedded objects are more reliable for macOS 11+
-                    hashtags = embedded_objects.get("hashtags", [])
-                    if not hashtags:
-                        # Fallback to regex extraction for older versions or when embedded objects aren't found
-                        hashtags = structure.get("hashtags", [])
 
-                    mentions = embedded_objects.get("mentions", [])
-                    if not mentions:
-                        mentions = structure.get("mentions", [])
-
-                    links = embedded_objects.get("links", [])
-                    if not links:
-                        links = structure.get("links", [])
+                    hashtags: list[str] = []
+                    mentions: list[str] = []
+                    links: list[str] = []
+                    if decode_embedded:
+                        structure = ProtobufParser.parse_note_structure(row[3])
+
+                        # Extract embedded objects (hashtags, mentions, links) from database
+                        embedded_objects = (
+                            self._embedded_extractor.get_embedded_objects_for_note(
+                                row[1]
+                            )
+                            if self._embedded_extractor
+                            else {}
+                        )
+
+                        # Combine hashtags from both protobuf content and embedded objects
+                        # Embedded objects are more reliable for macOS 11+
+                        hashtags = embedded_objects.get("hashtags", [])
+                        if not hashtags:
+                            # Fallback to regex extraction for older versions or when embedded objects aren't found
+                            hashtags = structure.get("hashtags", [])
+
+                        mentions = embedded_objects.get("mentions", [])
+                        if not mentions:
+                            mentions = structure.get("mentions", [])
+
+                        links = embedded_objects.get("links", [])
+                        if not links:
+                            links = structure.get("links", [])
 
                     # Convert Core Data timestamps to datetime
                     creation_date = self._convert_core_time(row[4]) if row[4] else None
@@ -684,22 +717,18 @@ class AppleNotesDatabase:
         Returns:
             datetime | None: Converted datetime object in local timezone, or None if invalid.
         """
-        try:
-            # Core Data timestamps are seconds since January 1, 2001 00:00:00 UTC
-            # Unix timestamps are seconds since January 1, 1970 00:00:00 UTC
-            # The difference is 978307200 seconds (31 years)
-
-            # Skip invalid timestamps (0, negative, or extremely large values)
-            if core_time <= 0 or core_time > MAX_TIMESTAMP_32BIT:
-                return None
-
-            unix_timestamp = core_time + CORE_DATA_EPOCH_OFFSET
-
-            # Additional validation for reasonable date range (1970-2100)
-            if unix_timestamp < 0 or unix_timestamp > MAX_TIMESTAMP_YEAR_2100:
-                return None
+        # Core Data timestamps are seconds since January 1, 2001 00:00:00 UTC
+        # Unix timestamps are seconds since January 1, 1970 00:00:00 UTC
+        # The difference is 978307200 seconds (31 years)
+
+        # Skip invalid timestamps: 0, negative, or extremely large values. The
+        # raw value must fit in 32 bits and the Unix time must fall before the
+        # year 2100; MAX_CORE_DATA_TIMESTAMP is the tighter of the two bounds.
+        if not 0 < core_time <= MAX_CORE_DATA_TIMESTAMP:
+            return None
 
-            return datetime.fromtimestamp(unix_timestamp)
+        try:
+            return datetime.fromtimestamp(core_time + CORE_DATA_EPOCH_OFFSET)
         except (ValueError, OSError, OverflowError):
             # Handle invalid timestamps gracefully
             return None
@@ -103,9 +103,10 @@ class EmbeddedObjectExtractor:
                         links.append(link)
 
             return {
-                "hashtags": list(set(hashtags)),  # Remove duplicates
-                "mentions": list(set(mentions)),
-                "links": list(set(links)),
+                # Remove duplicates, keeping first-seen order
+                "hashtags": list(dict.fromkeys(hashtags)),
+                "mentions": list(dict.fromkeys(mentions)),
+                "links": list(dict.fromkeys(links)),
             }
 
         except sqlite3.Error as e:
@@ -44,17 +44,13 @@ class Folder:
             str: Full folder path from root to this folder, separated by '/'.
         """
         path_parts = []
-        current_folder = self
+        current_folder: Folder | None = self
         visited = set()  # Prevent infinite loops
 
-        while current_folder and current_folder.id not in visited:
+        while current_folder is not None and current_folder.id not in visited:
             visited.add(current_folder.id)
             path_parts.append(current_folder.name)
-
-            if current_folder.parent:
-                current_folder = current_folder.parent
-            else:
-                break
+            current_folder = current_folder.parent
 
         # Reverse to get root-to-leaf order
         path_parts.reverse()
@@ -586,7 +582,8 @@ class Note:
         Returns:
             bool: True if the note contains the specified tag, False otherwise.
         """
-        return tag.lower() in [t.lower() for t in self.tags]
+        tag = tag.lower()
+        return any(t.lower() == tag for t in self.tags)
 
     def has_mention(self, mention: str) -> bool:
         """Check if the note has a specific mention.
@@ -597,7 +594,8 @@ class Note:
         Returns:
             bool: True if the note contains the specified mention, False otherwise.
         """
-        return mention.lower() in [m.lower() for m in self.mentions]
+        mention = mention.lower()
+        return any(m.lower() == mention for m in self.mentions)
 
     def has_link(self, link: str) -> bool:
         """Check if the note contains a specific link.
@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import json
 import logging
-from collections.abc import Callable
+from collections import Counter
+from collections.abc import Callable, Iterator
+from datetime import datetime
+from itertools import chain
+from typing import Any, TextIO
 
 from .database import AppleNotesDatabase
 from .exceptions import AppleNotesParserError, DatabaseError
@@ -33,6 +38,7 @@ class AppleNotesParser:
         self._accounts: list[Account] | None = None
         self._folders: list[Folder] | None = None
         self._notes: list[Note] | None = None
+        self._tag_index: dict[str, list[int]] = {}
 
     def load_data(self) -> None:
         """Load all data from the database.
@@ -59,6 +65,7 @@ class AppleNotesParser:
             self._accounts = accounts_list
             self._folders = folders_list
             self._notes = notes_list
+            self._tag_index = self._build_tag_index(notes_list)
 
     @property
     def accounts(self) -> list[Account]:
@@ -108,20 +115,44 @@ class AppleNotesParser:
         """
         return {folder.id: folder for folder in self.folders}
 
+    @staticmethod
+    def _build_tag_index(notes: list[Note]) -> dict[str, list[int]]:
+        """Build the index of lowercased tags to note positions.
+
+        Args:
+            notes: Notes to index.
+
+        Returns:
+            dict[str, list[int]]: Mapping of lowercased tag to the ascending
+                positions in ``notes`` of the notes that have it.
+        """
+        tag_index: dict[str, list[int]] = {}
+        for position, note in enumerate(notes):
+            for tag in {tag.lower() for tag in note.tags}:
+                tag_index.setdefault(tag, []).append(position)
+        return tag_index
+
     def get_notes_by_tag(self, tag: str) -> list[Note]:
         """Get all notes that have a specific tag.
 
+        Tags are indexed by load_data(). Changes to loaded notes' tags are not
+        seen until the data is loaded again.
+
         Args:
             tag: Tag to search for (case-insensitive).
 
         Returns:
             list[Note]: List of notes containing the specified tag.
         """
-        return [note for note in self.notes if note.has_tag(tag)]
+        notes = self.notes
+        return [notes[i] for i in self._tag_index.get(tag.lower(), [])]
 
     def get_notes_by_tags(self, tags: list[str], match_all: bool = False) -> list[Note]:
         """Get notes that have specific tags.
 
+        Tags are indexed by load_data(). Changes to loaded notes' tags are not
+        seen until the data is loaded again.
+
         Args:
             tags: List of tags to search for (case-insensitive).
             match_all: If True, note must have ALL tags. If False, note must have ANY tag.
@@ -130,14 +161,16 @@ class AppleNotesParser:
         Returns:
             list[Note]: List of notes matching the tag criteria.
         """
+        notes = self.notes
+        if match_all and not tags:
+            return list(notes)
+
+        matches = [set(self._tag_index.get(tag.lower(), [])) for tag in tags]
         if match_all:
-            return [
-                note for note in self.notes if all(note.has_tag(tag) for tag in tags)
-            ]
+            positions = set.intersection(*matches)
         else:
-            return [
-                note for note in self.notes if any(note.has_tag(tag) for tag in tags)
-            ]
+            positions = set().union(*matches)
+        return [notes[i] for i in sorted(positions)]
 
     def get_notes_by_folder(self, folder_name: str) -> list[Note]:
         """Get all notes in a specific folder.
@@ -466,15 +499,14 @@ class AppleNotesParser:
                         return db_tags
         except (DatabaseError, Exception) as e:
             logging.debug(
-                f"Failed to get hashtags from database: {e}. Falling back to note-based extraction."
+                "Failed to get hashtags from database: %s. "
+                "Falling back to note-based extraction.",
+                e,
             )
             pass  # Fall back to note-based extraction
 
         # Fallback: extract from loaded notes
-        all_tags = set()
-        for note in self.notes:
-            all_tags.update(note.tags)
-        return sorted(all_tags)
+        return sorted(set(chain.from_iterable(note.tags for note in self.notes)))
 
     def get_all_mentions(self) -> list[str]:
         """Get all unique mentions across all notes.
@@ -482,10 +514,7 @@ class AppleNotesParser:
         Returns:
             list[str]: Sorted list of all unique @mentions found in the database.
         """
-        all_mentions = set()
-        for note in self.notes:
-            all_mentions.update(note.mentions)
-        return sorted(all_mentions)
+        return sorted(set(chain.from_iterable(note.mentions for note in self.notes)))
 
     def get_tag_counts(self) -> dict[str, int]:
         """Get count of notes for each tag.
@@ -506,15 +535,14 @@ class AppleNotesParser:
                         return db_counts
         except (DatabaseError, Exception) as e:
             logging.debug(
-                f"Failed to get hashtag counts from database: {e}. Falling back to note-based counting."
+                "Failed to get hashtag counts from database: %s. "
+                "Falling back to note-based counting.",
+                e,
             )
             pass  # Fall back to note-based counting
 
         # Fallback: count from loaded notes
-        tag_counts: dict[str, int] = {}
-        for note in self.notes:
-            for tag in note.tags:
-                tag_counts[tag] = tag_counts.get(tag, 0) + 1
+        tag_counts = Counter(chain.from_iterable(note.tags for note in self.notes))
         return dict(sorted(tag_counts.items()))
 
     def get_folder_counts(self) -> dict[str, int]:
@@ -524,10 +552,7 @@ class AppleNotesParser:
             dict[str, int]: Dictionary mapping folder names to the number of notes
                           in each folder, sorted by folder name.
         """
-        folder_counts: dict[str, int] = {}
-        for note in self.notes:
-            folder_name = note.folder.name
-            folder_counts[folder_name] = folder_counts.get(folder_name, 0) + 1
+        folder_counts = Counter(note.folder.name for note in self.notes)
         return dict(sorted(folder_counts.items()))
 
     def get_account_counts(self) -> dict[str, int]:
@@ -537,13 +562,12 @@ class AppleNotesParser:
             dict[str, int]: Dictionary mapping account names to the number of notes
                           in each account, sorted by account name.
         """
-        account_counts: dict[str, int] = {}
-        for note in self.notes:
-            account_name = note.account.name
-            account_counts[account_name] = account_counts.get(account_name, 0) + 1
+        account_counts = Counter(note.account.name for note in self.notes)
         return dict(sorted(account_counts.items()))
 
-    def export_notes_to_dict(self, include_content: bool = True) -> dict:
+    def export_notes_to_dict(
+        self, include_content: bool = True, notes: list[Note] | None = None
+    ) -> dict:
         """Export all notes to a dictionary structure.
 
         Creates a comprehensive dictionary containing all accounts, folders,
@@ -553,87 +577,159 @@ class AppleNotesParser:
             include_content: Whether to include note content in the export.
                            Set to False for privacy or to reduce export size.
                            Defaults to True.
+            notes: Notes to export. Defaults to all notes. Accounts and folders
+                  are always exported in full.
 
         Returns:
             dict: Dictionary with 'accounts', 'folders', and 'notes' keys,
                  each containing lists of dictionaries with object data.
                  All dates are converted to ISO format strings.
         """
-
         return {
-            "accounts": [
-                {
-                    "id": account.id,
-                    "name": account.name,
-                    "identifier": account.identifier,
-                    "user_record_name": account.user_record_name,
-                }
-                for account in self.accounts
-            ],
-            "folders": [
-                {
-                    "id": folder.id,
-                    "name": folder.name,
-                    "account_name": folder.account.name,
-                    "uuid": folder.uuid,
-                    "parent_id": folder.parent_id,
-                    "path": folder.get_path(),
-                }
-                for folder in self.folders
-            ],
-            "notes": [
-                {
-                    "id": note.id,
-                    "note_id": note.note_id,
-                    "title": note.title,
-                    "content": note.content if include_content else None,
-                    "creation_date": (
-                        note.creation_date.isoformat() if note.creation_date else None
-                    ),
-                    "modification_date": (
-                        note.modification_date.isoformat()
-                        if note.modification_date
-                        else None
-                    ),
-                    "account_name": note.account.name,
-                    "folder_name": note.folder.name,
-                    "folder_path": note.get_folder_path(),
-                    "is_pinned": note.is_pinned,
-                    "is_password_protected": note.is_password_protected,
-                    "uuid": note.uuid,
-                    "applescript_id": note.applescript_id,
-                    "tags": note.tags,
-                    "mentions": note.mentions,
-                    "links": note.links,
-                    "attachments": [
-                        {
-                            "id": attachment.id,
-                            "filename": attachment.filename,
-                            "file_size": attachment.file_size,
-                            "type_uti": attachment.type_uti,
-                            "file_extension": attachment.file_extension,
-                            "mime_type": attachment.mime_type,
-                            "is_image": attachment.is_image,
-                            "is_video": attachment.is_video,
-                            "is_audio": attachment.is_audio,
-                            "is_document": attachment.is_document,
-                            "creation_date": (
-                                attachment.creation_date.isoformat()
-                                if attachment.creation_date
-                                else None
-                            ),
-                            "modification_date": (
-                                attachment.modification_date.isoformat()
-                                if attachment.modification_date
-                                else None
-                            ),
-                            "uuid": attachment.uuid,
-                            "is_remote": attachment.is_remote,
-                            "remote_url": attachment.remote_url,
-                        }
-                        for attachment in note.attachments
-                    ],
-                }
-                for note in self.notes
-            ],
+            key: list(records)
+            for key, records in self._export_sections(include_content, notes)
         }
+
+    def export_notes_to_json(
+        self,
+        fp: TextIO,
+        include_content: bool = True,
+        notes: list[Note] | None = None,
+        compact: bool = False,
+    ) -> None:
+        """Export all notes as JSON, streaming one record at a time.
+
+        Writes the same document as ``json.dump(export_notes_to_dict(), fp,
+        indent=2, ensure_ascii=False)`` without building the whole export
+        dictionary in memory first.
+
+        Args:
+            fp: Text file object to write to.
+            include_content: Whether to include note content in the export.
+                           Defaults to True.
+            notes: Notes to export. Defaults to all notes. Accounts and folders
+                  are always exported in full.
+            compact: Write compact JSON with no whitespace, as with
+                    ``separators=(",", ":")``, instead of indenting. This is
+                    faster and smaller. Defaults to False.
+        """
+        encode: Callable[[dict[str, Any]], str]
+        if compact:
+            newline, pad, key_separator = "", "", ":"
+            encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+            encode = encoder.encode
+        else:
+            newline, pad, key_separator = "\n", "  ", ": "
+            encoder = json.JSONEncoder(ensure_ascii=False, indent=2)
+
+            def encode(record: dict[str, Any]) -> str:
+                # Only indent the encoder's own newlines; str.splitlines()
+                # would also split on U+2028 and friends inside strings.
+                return "    " + encoder.encode(record).replace("\n", "\n    ")
+
+        separator = newline
+        fp.write("{")
+        for key, records in self._export_sections(include_content, notes):
+            fp.write(f"{separator}{pad}{json.dumps(key)}{key_separator}")
+            separator = f",{newline}"
+            empty = True
+            for record in records:
+                fp.write(f"[{newline}" if empty else f",{newline}")
+                fp.write(encode(record))
+                empty = False
+            fp.write("[]" if empty else f"{newline}{pad}]")
+        fp.write(f"{newline}}}")
+
+    def _export_sections(
+        self, include_content: bool, notes: list[Note] | None
+    ) -> list[tuple[str, Iterator[dict[str, Any]]]]:
+        """Get the export sections as lazily generated records.
+
+        Args:
+            include_content: Whether to include note content in the export.
+            notes: Notes to export, or None for all notes.
+
+        Returns:
+            list[tuple[str, Iterator[dict[str, Any]]]]: (key, records) pairs for
+                'accounts', 'folders' and 'notes', in export order.
+        """
+        if notes is None:
+            notes = self.notes
+        return [
+            ("accounts", (_account_to_dict(account) for account in self.accounts)),
+            ("folders", (_folder_to_dict(folder) for folder in self.folders)),
+            ("notes", (_note_to_dict(note, include_content) for note in notes)),
+        ]
+
+
+def _isoformat(value: datetime | None) -> str | None:
+    """Convert an optional datetime to an ISO format string."""
+    return value.isoformat() if value else None
+
+
+def _account_to_dict(account: Account) -> dict[str, Any]:
+    """Convert an account to its export dictionary."""
+    return {
+        "id": account.id,
+        "name": account.name,
+        "identifier": account.identifier,
+        "user_record_name": account.user_record_name,
+    }
+
+
+def _folder_to_dict(folder: Folder) -> dict[str, Any]:
+    """Convert a folder to its export dictionary."""
+    return {
+        "id": folder.id,
+        "name": folder.name,
+        "account_name": folder.account.name,
+        "uuid": folder.uuid,
+        "parent_id": folder.parent_id,
+        "path": folder.get_path(),
+    }
+
+
+def _attachment_to_dict(attachment: Attachment) -> dict[str, Any]:
+    """Convert an attachment to its export dictionary."""
+    return {
+        "id": attachment.id,
+        "filename": attachment.filename,
+        "file_size": attachment.file_size,
+        "type_uti": attachment.type_uti,
+        "file_extension": attachment.file_extension,
+        "mime_type": attachment.mime_type,
+        "is_image": attachment.is_image,
+        "is_video": attachment.is_video,
+        "is_audio": attachment.is_audio,
+        "is_document": attachment.is_document,
+        "creation_date": _isoformat(attachment.creation_date),
+        "modification_date": _isoformat(attachment.modification_date),
+        "uuid": attachment.uuid,
+        "is_remote": attachment.is_remote,
+        "remote_url": attachment.remote_url,
+    }
+
+
+def _note_to_dict(note: Note, include_content: bool) -> dict[str, Any]:
+    """Convert a note to its export dictionary."""
+    return {
+        "id": note.id,
+        "note_id": note.note_id,
+        "title": note.title,
+        "content": note.content if include_content else None,
+        "creation_date": _isoformat(note.creation_date),
+        "modification_date": _isoformat(note.modification_date),
+        "account_name": note.account.name,
+        "folder_name": note.folder.name,
+        "folder_path": note.get_folder_path(),
+        "is_pinned": note.is_pinned,
+        "is_password_protected": note.is_password_protected,
+        "uuid": note.uuid,
+        "applescript_id": note.applescript_id,
+        "tags": note.tags,
+        "mentions": note.mentions,
+        "links": note.links,
+        "attachments": [
+            _attachment_to_dict(attachment) for attachment in note.attachments
+        ],
+    }
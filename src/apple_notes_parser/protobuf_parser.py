@@ -11,6 +11,13 @@ from google.protobuf.message import DecodeError
 from .exceptions import ProtobufError
 from .notestore_pb2 import NoteStoreProto
 
+# Patterns compiled once at import time rather than looked up per call
+_HASHTAG_RE = re.compile(r"#(\w+)")
+_MENTION_RE = re.compile(r"@(\w+)")
+_URL_RE = re.compile(r'https?://[^\s<>"{}|\\^`\[\]]+[^\s<>"{}|\\^`\[\].,!?;:)]')
+_NON_PRINTABLE_RE = re.compile(r"[^\x20-\x7E\n\r\t]")
+_WHITESPACE_RE = re.compile(r"\s+")
+
 
 class ProtobufParser:
     """Handles parsing of Apple Notes protobuf data."""
@@ -83,9 +90,9 @@ class ProtobufParser:
             # Try to find readable text in the binary data
             text = data.decode("utf-8", errors="ignore")
             # Clean up the text by removing non-printable characters
-            text = re.sub(r"[^\x20-\x7E\n\r\t]", "", text)
+            text = _NON_PRINTABLE_RE.sub("", text)
             # Remove excessive whitespace
-            text = re.sub(r"\s+", " ", text).strip()
+            text = _WHITESPACE_RE.sub(" ", text).strip()
             return text if text else None
         except (UnicodeDecodeError, ValueError, re.error):
             return None
@@ -100,15 +107,14 @@ class ProtobufParser:
             text: Note text content to search.
 
         Returns:
-            list[str]: List of unique hashtags found (without # symbol).
+            list[str]: List of unique hashtags found (without # symbol), in order
+                of first appearance.
         """
         if not text:
             return []
 
-        # Pattern to match hashtags
-        hashtag_pattern = r"#(\w+)"
-        matches = re.findall(hashtag_pattern, text)
-        return list(set(matches))  # Remove duplicates
+        # Remove duplicates, keeping first-seen order
+        return list(dict.fromkeys(_HASHTAG_RE.findall(text)))
 
     @staticmethod
     def extract_mentions(text: str) -> list[str]:
@@ -120,15 +126,14 @@ class ProtobufParser:
             text: Note text content to search.
 
         Returns:
-            list[str]: List of unique mentions found (without @ symbol).
+            list[str]: List of unique mentions found (without @ symbol), in order
+                of first appearance.
         """
         if not text:
             return []
 
-        # Pattern to match @mentions
-        mention_pattern = r"@(\w+)"
-        matches = re.findall(mention_pattern, text)
-        return list(set(matches))  # Remove duplicates
+        # Remove duplicates, keeping first-seen order
+        return list(dict.fromkeys(_MENTION_RE.findall(text)))
 
     @staticmethod
     def extract_links(text: str) -> list[str]:
@@ -140,15 +145,13 @@ class ProtobufParser:
             text: Note text content to search.
 
         Returns:
-            list[str]: List of unique URLs found.
+            list[str]: List of unique URLs found, in order of first appearance.
         """
         if not text:
             return []
 
-        # Pattern to match URLs
-        url_pattern = r'https?://[^\s<>"{}|\\^`\[\]]+[^\s<>"{}|\\^`\[\].,!?;:)]'
-        matches = re.findall(url_pattern, text)
-        return list(set(matches))  # Remove duplicates
+        # Remove duplicates, keeping first-seen order
+        return list(dict.fromkeys(_URL_RE.findall(text)))
 
     @staticmethod
     def parse_note_structure(zdata: bytes) -> dict[str, Any]:
@@ -2,18 +2,46 @@
 Pytest fixtures for Apple Notes Parser tests.
 """
 
+import copy
+import functools
 import sys
 from pathlib import Path
+from typing import NamedTuple
 
 import pytest
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+from apple_notes_parser import AppleNotesParser
 from apple_notes_parser.database import AppleNotesDatabase
+from apple_notes_parser.models import Account, Attachment, Folder, Note
 
 
-@pytest.fixture
+class LoadedFolders(NamedTuple):
+    """Folders loaded from a database, with lookup indexes."""
+
+    folders_list: list[Folder]
+    folders_dict: dict[int, Folder]
+    folders_by_name: dict[str, Folder]
+
+
+class LoadedDatabase(NamedTuple):
+    """Accounts, folders and notes loaded from a database, with ID lookups."""
+
+    macos_version: int
+    accounts: list[Account]
+    accounts_dict: dict[int, Account]
+    folders: list[Folder]
+    folders_dict: dict[int, Folder]
+    folder_names: frozenset[str]
+    notes: list[Note]
+    notes_by_title: dict[str, Note]
+    attachments_by_filename: dict[str, tuple[Note, Attachment]]
+    attachments_by_uuid: dict[str, tuple[Note, Attachment]]
+
+
+@pytest.fixture(scope="session")
 def test_database():
     """Fixture providing path to the test macOS 15 NoteStore database."""
     database_path = Path(__file__).parent / "data" / "NoteStore-macOS-15-Seqoia.sqlite"
@@ -22,6 +50,114 @@ def test_database():
     return str(database_path)
 
 
+@pytest.fixture(scope="session")
+def loaded_parser(test_database):
+    """Fixture providing an AppleNotesParser with data loaded once per session.
+
+    Tests using this fixture must treat the parser and its notes as read-only.
+    """
+    parser = AppleNotesParser(test_database)
+    parser.load_data()
+    return parser
+
+
+@pytest.fixture(scope="session")
+def accounts_list(test_database):
+    """Fixture providing the test database accounts, loaded once per session."""
+    with AppleNotesDatabase(test_database) as db:
+        return db.get_accounts()
+
+
+@pytest.fixture(scope="session")
+def accounts_dict(accounts_list):
+    """Fixture mapping account IDs to accounts."""
+    return {acc.id: acc for acc in accounts_list}
+
+
+@pytest.fixture(scope="session")
+def folders_list(test_database, accounts_dict):
+    """Fixture providing the test database folders, loaded once per session.
+
+    Tests using this fixture must not mutate the folders; use fresh_folders.
+    """
+    with AppleNotesDatabase(test_database) as db:
+        return db.get_folders(accounts_dict)
+
+
+@pytest.fixture(scope="session")
+def folders_dict(folders_list):
+    """Fixture mapping folder IDs to folders."""
+    return {folder.id: folder for folder in folders_list}
+
+
+@pytest.fixture(scope="session")
+def folders_by_name(folders_list):
+    """Fixture mapping folder names to folders."""
+    return {folder.name: folder for folder in folders_list}
+
+
+@pytest.fixture(scope="session")
+def paths_by_name(folders_list):
+    """Fixture mapping folder names to their full paths, computed once."""
+    return {folder.name: folder.get_path() for folder in folders_list}
+
+
+@pytest.fixture(scope="session")
+def loaded_folders(folders_list, folders_dict, folders_by_name):
+    """Fixture bundling the session folders and their lookup indexes."""
+    return LoadedFolders(folders_list, folders_dict, folders_by_name)
+
+
+@pytest.fixture
+def fresh_folders(folders_list):
+    """Fixture providing a private copy of the folders for mutating tests."""
+    folders_copy = copy.deepcopy(folders_list)
+    return LoadedFolders(
+        folders_copy,
+        {folder.id: folder for folder in folders_copy},
+        {folder.name: folder for folder in folders_copy},
+    )
+
+
+@pytest.fixture(scope="session")
+def load_database():
+    """Fixture providing a loader that reads each database at most once per session.
+
+    Tests using the loaded data must treat it as read-only.
+    """
+
+    @functools.cache
+    def load(database_path: str) -> LoadedDatabase:
+        with AppleNotesDatabase(database_path, immutable=True) as db:
+            macos_version = db.get_macos_version()
+            accounts = db.get_accounts()
+            accounts_dict = {acc.id: acc for acc in accounts}
+            folders = db.get_folders(accounts_dict)
+            folders_dict = {f.id: f for f in folders}
+            notes = db.get_notes(accounts_dict, folders_dict)
+        folder_names = frozenset(f.name for f in folders)
+        notes_by_title = {n.title: n for n in notes if n.title}
+        note_attachments = [(n, a) for n in notes for a in n.attachments]
+        attachments_by_filename = {
+            a.filename: (n, a) for n, a in note_attachments if a.filename
+        }
+        attachments_by_uuid = {a.uuid: (n, a) for n, a in note_attachments if a.uuid}
+        return LoadedDatabase(
+            macos_version,
+            accounts,
+            accounts_dict,
+            folders,
+            folders_dict,
+            folder_names,
+            notes,
+            notes_by_title,
+            attachments_by_filename,
+            attachments_by_uuid,
+        )
+
+    return load
+
+
 @pytest.fixture
 def database_with_connection(test_database):
     """Fixture providing a connected AppleNotesDatabase instance."""
@@ -154,6 +290,26 @@ def macos_14_database():
     return str(database_path)
 
 
+@pytest.fixture(scope="session")
+def macos_26_database():
+    """Fixture providing path to the macOS 26 NoteStore database."""
+    database_path = Path(__file__).parent / "data" / "NoteStore-macOS-26-Tahoe.sqlite"
+    if not database_path.exists():
+        pytest.skip(f"macOS 26 database not found at {database_path}")
+    return str(database_path)
+
+
+@pytest.fixture
+def macos_loaded(macos_database, load_database):
+    """Fixture providing a macOS version's data, loaded once per session.
+
+    Test modules select the version by defining a ``macos_database`` fixture
+    that returns one of the macos_NN_database paths. Tests using this fixture
+    must treat the loaded objects as read-only.
+    """
+    return load_database(macos_database)
+
+
 @pytest.fixture
 def macos_15_database():
     """Fixture providing path to the macOS 15 NoteStore database."""
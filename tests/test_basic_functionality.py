@@ -2,7 +2,10 @@
 Basic pytest tests for apple-notes-parser functionality.
 """
 
+import shutil
+import sqlite3
 import sys
+from datetime import datetime
 from pathlib import Path
 
 import pytest
@@ -11,9 +14,13 @@ import pytest
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from apple_notes_parser import AppleNotesParser
-from apple_notes_parser.database import AppleNotesDatabase
+from apple_notes_parser.database import (
+    CORE_DATA_EPOCH_OFFSET,
+    MAX_CORE_DATA_TIMESTAMP,
+    AppleNotesDatabase,
+)
 from apple_notes_parser.exceptions import AppleNotesParserError, DatabaseError
-from apple_notes_parser.models import Account, Folder
+from apple_notes_parser.models import Account, Folder, Note
 
 
 def test_parser_initialization_with_nonexistent_file():
@@ -38,24 +45,19 @@ def test_account_loading(test_database):
         assert on_my_mac is not None
 
 
-def test_folder_loading(test_database):
+def test_folder_loading(folders_list):
     """Test loading folders from database directly."""
-    with AppleNotesDatabase(test_database) as db:
-        accounts_list = db.get_accounts()
-        accounts_dict = {acc.id: acc for acc in accounts_list}
-        folders_list = db.get_folders(accounts_dict)
-
-        assert len(folders_list) == 6
-        folder_names = {f.name for f in folders_list}
-        expected_names = {
-            "Notes",
-            "Recently Deleted",
-            "Folder",
-            "Folder2",
-            "Subfolder",
-            "Subsubfolder",
-        }
-        assert folder_names == expected_names
+    assert len(folders_list) == 6
+    folder_names = {f.name for f in folders_list}
+    expected_names = {
+        "Notes",
+        "Recently Deleted",
+        "Folder",
+        "Folder2",
+        "Subfolder",
+        "Subsubfolder",
+    }
+    assert folder_names == expected_names
 
 
 def test_macos_version_detection(test_database):
@@ -73,46 +75,36 @@ def test_z_uuid_extraction(test_database):
         assert z_uuid == "09FBEB4A-5B24-424E-814B-4AE8E757FB83"
 
 
-def test_folders_dict_property(test_database):
+def test_folders_dict_property(folders_list, folders_dict):
     """Test folders_dict property provides correct mapping."""
-    with AppleNotesDatabase(test_database) as db:
-        accounts_list = db.get_accounts()
-        accounts_dict = {acc.id: acc for acc in accounts_list}
-        folders_list = db.get_folders(accounts_dict)
-        folders_dict = {folder.id: folder for folder in folders_list}
+    assert len(folders_dict) == 6
 
-        assert len(folders_dict) == 6
+    # Check that all folder IDs are mapped correctly
+    for folder in folders_list:
+        assert folder.id in folders_dict
+        assert folders_dict[folder.id] == folder
 
-        # Check that all folder IDs are mapped correctly
-        for folder in folders_list:
-            assert folder.id in folders_dict
-            assert folders_dict[folder.id] == folder
 
-
-def test_export_structure(test_database):
+def test_export_structure(accounts_list, folders_list):
     """Test that basic database structure can be read."""
-    with AppleNotesDatabase(test_database) as db:
-        accounts_list = db.get_accounts()
-        folders_list = db.get_folders({acc.id: acc for acc in accounts_list})
-
-        # Check accounts structure
-        assert len(accounts_list) == 1
-        account = accounts_list[0]
-        assert hasattr(account, "id")
-        assert hasattr(account, "name")
-        assert hasattr(account, "identifier")
-
-        # Check folders structure
-        assert len(folders_list) == 6
-        folder = folders_list[0]
-        assert hasattr(folder, "id")
-        assert hasattr(folder, "name")
-        assert hasattr(folder, "parent_id")
-
-        # Test folder path functionality
-        paths = [f.get_path() for f in folders_list]
-        assert len(paths) == 6
-        assert any("/" in path for path in paths)  # Some paths should have hierarchy
+    # Check accounts structure
+    assert len(accounts_list) == 1
+    account = accounts_list[0]
+    assert hasattr(account, "id")
+    assert hasattr(account, "name")
+    assert hasattr(account, "identifier")
+
+    # Check folders structure
+    assert len(folders_list) == 6
+    folder = folders_list[0]
+    assert hasattr(folder, "id")
+    assert hasattr(folder, "name")
+    assert hasattr(folder, "parent_id")
+
+    # Test folder path functionality
+    paths = [f.get_path() for f in folders_list]
+    assert len(paths) == 6
+    assert any("/" in path for path in paths)  # Some paths should have hierarchy
 
 
 def test_folder_model_methods():
@@ -138,6 +130,40 @@ def test_folder_model_methods():
     assert child_folder.get_path() == "Root/Child"
 
 
+def test_note_membership_methods():
+    """Test Note tag, mention and link lookups, including after list changes."""
+    account = Account(id=1, name="Test", identifier="test")
+    folder = Folder(id=1, name="Root", account=account)
+    note = Note(
+        id=1,
+        note_id=1,
+        title="Test",
+        content=None,
+        creation_date=None,
+        modification_date=None,
+        account=account,
+        folder=folder,
+        tags=["Travel"],
+        mentions=["Alice"],
+        links=["https://example.com"],
+    )
+
+    assert note.has_tag("travel")
+    assert not note.has_tag("work")
+    assert note.has_mention("alice")
+    assert note.has_link("https://example.com")
+    assert not note.has_link("HTTPS://EXAMPLE.COM")
+
+    # Lookups follow in-place changes and reassignment
+    note.tags.append("Work")
+    assert note.has_tag("work")
+    note.tags[0] = "Home"
+    assert note.has_tag("home")
+    assert not note.has_tag("travel")
+    note.tags = []
+    assert not note.has_tag("travel")
+
+
 def test_database_error_propagation():
     """Test that database errors are properly propagated."""
     with pytest.raises((AppleNotesParserError, DatabaseError)):
@@ -155,3 +181,48 @@ def test_context_manager_cleanup(test_database):
 
     # Connection should be closed after context manager
     assert db.connection is None
+
+
+def test_immutable_connection(test_database, accounts_list):
+    """Test that an immutable connection reads the same data and cannot write."""
+    with AppleNotesDatabase(test_database, immutable=True) as db:
+        assert db.get_accounts() == accounts_list
+        assert db.get_macos_version() == 15
+
+        with pytest.raises(sqlite3.OperationalError):
+            db.connection.execute("CREATE TABLE scratch (id INTEGER)")
+
+
+@pytest.mark.parametrize(
+    ("core_time", "accepted"),
+    [
+        (0, False),
+        (-1.5, False),
+        (MAX_CORE_DATA_TIMESTAMP, True),
+        (MAX_CORE_DATA_TIMESTAMP + 1, False),
+    ],
+)
+def test_core_time_bounds(test_database, core_time, accepted):
+    """Test which Core Data timestamps are converted and which are rejected."""
+    db = AppleNotesDatabase(test_database)
+    expected = (
+        datetime.fromtimestamp(core_time + CORE_DATA_EPOCH_OFFSET) if accepted else None
+    )
+    assert db._convert_core_time(core_time) == expected
+
+
+def test_default_connection_is_query_only(test_database, tmp_path):
+    """Test that a default connection rejects writes."""
+    # Work on a copy so a regression cannot modify the shared test database
+    database_path = tmp_path / "NoteStore.sqlite"
+    shutil.copy(test_database, database_path)
+
+    with AppleNotesDatabase(str(database_path)) as db:
+        with pytest.raises(sqlite3.OperationalError):
+            db.connection.execute(
+                "INSERT INTO ZICCLOUDSYNCINGOBJECT (ZTITLE2) VALUES ('scratch')"
+            )
+        with pytest.raises(sqlite3.OperationalError):
+            db.connection.execute(
+                "UPDATE ZICCLOUDSYNCINGOBJECT SET ZTITLE2 = 'scratch'"
+            )
@@ -3,28 +3,76 @@ Tests for the CLI interface using CliRunner.
 """
 
 import json
-import tempfile
-from pathlib import Path
+import re
 
 import pytest
 from clirunner import CliRunner
 
 from apple_notes_parser.cli import main
 
-
-@pytest.fixture
+# Dates are formatted as YYYY-MM-DD HH:MM:SS
+_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}")
+
+# Sizes are formatted as e.g. "0 B" or "179.9 KB"
+_SIZE_RE = re.compile(r"\b\d+(?:\.\d)? (?:B|KB|MB|GB|TB)\b")
+
+
+# Keys every exported record must carry
+_EXPORT_KEYS = {
+    "accounts": {"id", "name", "identifier", "user_record_name"},
+    "folders": {"id", "name", "account_name", "uuid", "parent_id", "path"},
+    "notes": {
+        "id",
+        "note_id",
+        "title",
+        "content",
+        "creation_date",
+        "modification_date",
+        "account_name",
+        "folder_name",
+        "folder_path",
+        "is_pinned",
+        "is_password_protected",
+        "uuid",
+        "applescript_id",
+        "tags",
+        "mentions",
+        "links",
+        "attachments",
+    },
+}
+
+
+def _validate_export(data):
+    """Assert that exported JSON has the expected top-level and record keys."""
+    assert isinstance(data, dict)
+    assert data.keys() == _EXPORT_KEYS.keys()
+    for section, keys in _EXPORT_KEYS.items():
+        assert isinstance(data[section], list)
+        for record in data[section]:
+            assert keys <= record.keys(), f"{section} record missing keys"
+
+
+@pytest.fixture(scope="module")
 def runner():
-    """Fixture providing a CliRunner instance."""
+    """Fixture providing a CliRunner instance shared by the module's tests."""
     return CliRunner()
 
 
-@pytest.fixture
-def test_database():
-    """Fixture providing path to test database."""
-    database_path = Path(__file__).parent / "data" / "NoteStore-macOS-15-Seqoia.sqlite"
-    if not database_path.exists():
-        pytest.skip(f"Test database not found at {database_path}")
-    return str(database_path)
+@pytest.fixture(scope="module")
+def exported_data(runner, test_database, tmp_path_factory):
+    """Run the export command once and return the validated JSON data."""
+    output_path = tmp_path_factory.mktemp("export") / "export.json"
+    result = runner.invoke(
+        main, ["--database", test_database, "export", str(output_path)]
+    )
+    assert result.exit_code == 0
+    assert "Exported" in result.output
+
+    with open(output_path) as f:
+        data = json.load(f)
+    _validate_export(data)
+    return data
 
 
 # Basic CLI functionality tests
@@ -169,60 +217,47 @@ def test_search_with_content(runner, test_database):
     assert result.exit_code == 0
 
 
-def test_export_basic(runner, test_database):
+def test_export_basic(exported_data):
     """Test basic export command."""
-    with tempfile.NamedTemporaryFile(
-        mode="w", suffix=".json", delete=False
-    ) as tmp_file:
-        tmp_path = tmp_file.name
-
-    try:
-        result = runner.invoke(main, ["--database", test_database, "export", tmp_path])
-        assert result.exit_code == 0
-        assert "Exported" in result.output
-
-        # Verify the JSON file was created and is valid
-        with open(tmp_path) as f:
-            data = json.load(f)
-            assert "notes" in data
-            assert "folders" in data
-            assert "accounts" in data
-    finally:
-        Path(tmp_path).unlink(missing_ok=True)
-
-
-def test_export_with_folder_filter(runner, test_database):
+    assert exported_data["notes"]
+    assert exported_data["folders"]
+    assert exported_data["accounts"]
+
+
+def test_export_with_folder_filter(runner, test_database, tmp_path):
     """Test export with folder filter."""
-    with tempfile.NamedTemporaryFile(
-        mode="w", suffix=".json", delete=False
-    ) as tmp_file:
-        tmp_path = tmp_file.name
-
-    try:
-        result = runner.invoke(
-            main, ["--database", test_database, "export", tmp_path, "--folder", "Notes"]
-        )
-        assert result.exit_code == 0
-        assert "Exported" in result.output
-    finally:
-        Path(tmp_path).unlink(missing_ok=True)
+    output_path = tmp_path / "export.json"
+    result = runner.invoke(
+        main,
+        ["--database", test_database, "export", str(output_path), "--folder", "Notes"],
+    )
+    assert result.exit_code == 0
+    assert "Exported" in result.output
 
 
-def test_export_no_content(runner, test_database):
+def test_export_no_content(runner, test_database, tmp_path):
     """Test export without content."""
-    with tempfile.NamedTemporaryFile(
-        mode="w", suffix=".json", delete=False
-    ) as tmp_file:
-        tmp_path = tmp_file.name
-
-    try:
-        result = runner.invoke(
-            main, ["--database", test_database, "export", tmp_path, "--no-content"]
-        )
-        assert result.exit_code == 0
-        assert "Exported" in result.output
-    finally:
-        Path(tmp_path).unlink(missing_ok=True)
+    output_path = tmp_path / "export.json"
+    result = runner.invoke(
+        main,
+        ["--database", test_database, "export", str(output_path), "--no-content"],
+    )
+    assert result.exit_code == 0
+    assert "Exported" in result.output
+
+
+def test_export_compact(runner, test_database, exported_data, tmp_path):
+    """Test compact export writes the same data without indentation."""
+    output_path = tmp_path / "export.json"
+    result = runner.invoke(
+        main, ["--database", test_database, "export", str(output_path), "--compact"]
+    )
+    assert result.exit_code == 0
+    assert "Exported" in result.output
+
+    text = output_path.read_text(encoding="utf-8")
+    assert "\n" not in text
+    assert json.loads(text) == exported_data
 
 
 def test_stats_basic(runner, test_database):
@@ -374,11 +409,7 @@ def test_date_formatting(runner, test_database):
     """Test date formatting in output."""
     result = runner.invoke(main, ["--database", test_database, "list"])
     assert result.exit_code == 0
-    # Dates should be formatted as YYYY-MM-DD HH:MM:SS
-    import re
-
-    date_pattern = r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}"
-    assert re.search(date_pattern, result.output)
+    assert _DATE_RE.search(result.output)
 
 
 def test_size_formatting(runner, test_database):
@@ -386,15 +417,14 @@ def test_size_formatting(runner, test_database):
     result = runner.invoke(main, ["--database", test_database, "attachments"])
     assert result.exit_code == 0
     # Should show size formatting (B, KB, MB, etc.)
-    size_units = ["B", "KB", "MB", "GB"]
-    has_size_unit = any(unit in result.output for unit in size_units)
+    has_size_unit = bool(_SIZE_RE.search(result.output))
     # Only assert if there are attachments
     if "attachment(s)" in result.output and not result.output.startswith("Found 0"):
         assert has_size_unit or "Unknown" in result.output
 
 
 # Integration tests
-def test_full_workflow(runner, test_database):
+def test_full_workflow(runner, test_database, tmp_path):
     """Test a complete workflow: list, search, export."""
     # First, list notes
     list_result = runner.invoke(main, ["--database", test_database, "list"])
@@ -405,24 +435,14 @@ def test_full_workflow(runner, test_database):
     assert search_result.exit_code == 0
 
     # Export to temporary file
-    with tempfile.NamedTemporaryFile(
-        mode="w", suffix=".json", delete=False
-    ) as tmp_file:
-        tmp_path = tmp_file.name
-
-    try:
-        export_result = runner.invoke(
-            main, ["--database", test_database, "export", tmp_path]
-        )
-        assert export_result.exit_code == 0
-
-        # Verify export was successful
-        assert Path(tmp_path).exists()
-        with open(tmp_path) as f:
-            data = json.load(f)
-            assert isinstance(data, dict)
-    finally:
-        Path(tmp_path).unlink(missing_ok=True)
+    output_path = tmp_path / "export.json"
+    export_result = runner.invoke(
+        main, ["--database", test_database, "export", str(output_path)]
+    )
+    assert export_result.exit_code == 0
+
+    # Verify export was successful
+    _validate_export(json.loads(output_path.read_text()))
 
 
 def test_all_commands_work(runner, test_database):
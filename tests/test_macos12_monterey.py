@@ -14,6 +14,12 @@ from apple_notes_parser import AppleNotesParser
 from apple_notes_parser.database import AppleNotesDatabase
 
 
+@pytest.fixture
+def macos_database(macos_12_database):
+    """Fixture selecting the macOS 12 database for macos_loaded."""
+    return macos_12_database
+
+
 @pytest.fixture
 def macos12_db_connection(macos_12_database):
     """Fixture providing a connected AppleNotesDatabase instance for macOS 12."""
@@ -33,29 +39,25 @@ def test_macos12_z_uuid_extraction(macos12_db_connection):
     assert z_uuid == "FABDAB03-8EF2-41B9-9944-193D67BE0365"
 
 
-def test_macos12_basic_data_extraction(macos12_db_connection):
+def test_macos12_basic_data_extraction(macos_loaded):
     """Test basic data extraction from macOS 12 database."""
     # Test accounts
-    accounts = macos12_db_connection.get_accounts()
+    accounts = macos_loaded.accounts
     assert len(accounts) == 1
     assert accounts[0].name == "On My Mac"
 
     # Test folders
-    accounts_dict = {acc.id: acc for acc in accounts}
-    folders = macos12_db_connection.get_folders(accounts_dict)
+    folders = macos_loaded.folders
     assert len(folders) == 6
 
     # Test notes
-    folders_dict = {f.id: f for f in folders}
-    notes = macos12_db_connection.get_notes(accounts_dict, folders_dict)
+    notes = macos_loaded.notes
     assert len(notes) == 7
 
 
-def test_macos12_folder_structure(macos12_db_connection):
+def test_macos12_folder_structure(macos_loaded):
     """Test folder hierarchy in macOS 12 database."""
-    accounts = macos12_db_connection.get_accounts()
-    accounts_dict = {acc.id: acc for acc in accounts}
-    folders = macos12_db_connection.get_folders(accounts_dict)
+    folders = macos_loaded.folders
 
     # Verify expected folders exist
     folder_names = {f.name for f in folders}
@@ -88,16 +90,10 @@ def test_macos12_folder_structure(macos12_db_connection):
     assert subsubfolder.get_parent().name == "Subfolder"
 
 
-def test_macos12_notes_content(macos12_db_connection):
+def test_macos12_notes_content(macos_loaded):
     """Test note content extraction from macOS 12 database."""
-    accounts = macos12_db_connection.get_accounts()
-    accounts_dict = {acc.id: acc for acc in accounts}
-    folders = macos12_db_connection.get_folders(accounts_dict)
-    folders_dict = {f.id: f for f in folders}
-    notes = macos12_db_connection.get_notes(accounts_dict, folders_dict)
-
     # Find specific notes by title
-    notes_by_title = {n.title: n for n in notes if n.title}
+    notes_by_title = macos_loaded.notes_by_title
 
     # Test password protected note
     protected_note = notes_by_title.get("This note is password protected")
@@ -129,13 +125,9 @@ def test_macos12_notes_content(macos12_db_connection):
     assert deep_note.folder.name == "Subsubfolder"
 
 
-def test_macos12_applescript_ids(macos12_db_connection):
+def test_macos12_applescript_ids(macos_loaded):
     """Test AppleScript ID construction for macOS 12 database."""
-    accounts = macos12_db_connection.get_accounts()
-    accounts_dict = {acc.id: acc for acc in accounts}
-    folders = macos12_db_connection.get_folders(accounts_dict)
-    folders_dict = {f.id: f for f in folders}
-    notes = macos12_db_connection.get_notes(accounts_dict, folders_dict)
+    notes = macos_loaded.notes
 
     # All notes should have AppleScript IDs
     for note in notes:
@@ -145,7 +137,7 @@ def test_macos12_applescript_ids(macos12_db_connection):
         assert "FABDAB03-8EF2-41B9-9944-193D67BE0365" in note.applescript_id
 
     # Test specific AppleScript IDs match expected pattern
-    notes_by_title = {n.title: n for n in notes if n.title}
+    notes_by_title = macos_loaded.notes_by_title
     simple_note = notes_by_title.get("This is a note")
     assert simple_note is not None
     assert (
@@ -246,11 +238,8 @@ def test_macos12_deleted_notes_support(macos_12_database):
     parser = AppleNotesParser(macos_12_database)
 
     # Find the recently deleted folder
-    recently_deleted_folder = None
-    for folder in parser.folders:
-        if folder.name == "Recently Deleted":
-            recently_deleted_folder = folder
-            break
+    folders_by_name = {f.name: f for f in parser.folders}
+    recently_deleted_folder = folders_by_name.get("Recently Deleted")
 
     assert recently_deleted_folder is not None, (
         "Recently Deleted folder should exist in macOS 12"
@@ -258,7 +247,7 @@ def test_macos12_deleted_notes_support(macos_12_database):
 
     # Find notes in recently deleted folder
     deleted_notes = [
-        note for note in parser.notes if note.folder.name == "Recently Deleted"
+        note for note in parser.notes if note.folder is recently_deleted_folder
     ]
     assert len(deleted_notes) >= 1, "Should have at least one deleted note"
 
@@ -14,6 +14,12 @@ from apple_notes_parser import AppleNotesParser
 from apple_notes_parser.database import AppleNotesDatabase
 
 
+@pytest.fixture
+def macos_database(macos_13_database):
+    """Fixture selecting the macOS 13 database for macos_loaded."""
+    return macos_13_database
+
+
 @pytest.fixture
 def macos13_db_connection(macos_13_database):
     """Fixture providing a connected AppleNotesDatabase instance for macOS 13."""
@@ -33,29 +39,25 @@ def test_macos13_z_uuid_extraction(macos13_db_connection):
     assert z_uuid == "B1676C6D-218E-4208-9F99-0EE88571CFD4"
 
 
-def test_macos13_basic_data_extraction(macos13_db_connection):
+def test_macos13_basic_data_extraction(macos_loaded):
     """Test basic data extraction from macOS 13 database."""
     # Test accounts
-    accounts = macos13_db_connection.get_accounts()
+    accounts = macos_loaded.accounts
     assert len(accounts) == 1
     assert accounts[0].name == "On My Mac"
 
     # Test folders
-    accounts_dict = {acc.id: acc for acc in accounts}
-    folders = macos13_db_connection.get_folders(accounts_dict)
+    folders = macos_loaded.folders
     assert len(folders) == 6
 
     # Test notes
-    folders_dict = {f.id: f for f in folders}
-    notes = macos13_db_connection.get_notes(accounts_dict, folders_dict)
+    notes = macos_loaded.notes
     assert len(notes) == 8
 
 
-def test_macos13_folder_structure(macos13_db_connection):
+def test_macos13_folder_structure(macos_loaded):
     """Test folder hierarchy in macOS 13 database."""
-    accounts = macos13_db_connection.get_accounts()
-    accounts_dict = {acc.id: acc for acc in accounts}
-    folders = macos13_db_connection.get_folders(accounts_dict)
+    folders = macos_loaded.folders
 
     # Verify expected folders exist
     folder_names = {f.name for f in folders}
@@ -88,16 +90,10 @@ def test_macos13_folder_structure(macos13_db_connection):
     assert subsubfolder.get_parent().name == "Subfolder"
 
 
-def test_macos13_notes_content(macos13_db_connection):
+def test_macos13_notes_content(macos_loaded):
     """Test note content extraction from macOS 13 database."""
-    accounts = macos13_db_connection.get_accounts()
-    accounts_dict = {acc.id: acc for acc in accounts}
-    folders = macos13_db_connection.get_folders(accounts_dict)
-    folders_dict = {f.id: f for f in folders}
-    notes = macos13_db_connection.get_notes(accounts_dict, folders_dict)
-
     # Find specific notes by title
-    notes_by_title = {n.title: n for n in notes if n.title}
+    notes_by_title = macos_loaded.notes_by_title
 
     # Test tagged note (macOS 13 specific feature)
     tagged_note = notes_by_title.get("This note has tags")
@@ -130,13 +126,9 @@ def test_macos13_notes_content(macos13_db_connection):
     assert deep_note.folder.name == "Subsubfolder"
 
 
-def test_macos13_applescript_ids(macos13_db_connection):
+def test_macos13_applescript_ids(macos_loaded):
     """Test AppleScript ID construction for macOS 13 database."""
-    accounts = macos13_db_connection.get_accounts()
-    accounts_dict = {acc.id: acc for acc in accounts}
-    folders = macos13_db_connection.get_folders(accounts_dict)
-    folders_dict = {f.id: f for f in folders}
-    notes = macos13_db_connection.get_notes(accounts_dict, folders_dict)
+    notes = macos_loaded.notes
 
     # All notes should have AppleScript IDs
     for note in notes:
@@ -146,7 +138,7 @@ def test_macos13_applescript_ids(macos13_db_connection):
         assert "B1676C6D-218E-4208-9F99-0EE88571CFD4" in note.applescript_id
 
     # Test specific AppleScript IDs match expected pattern
-    notes_by_title = {n.title: n for n in notes if n.title}
+    notes_by_title = macos_loaded.notes_by_title
     simple_note = notes_by_title.get("This is a note")
     assert simple_note is not None
     assert (
@@ -385,13 +377,9 @@ def test_macos13_embedded_object_extraction(macos13_db_connection):
         assert isinstance(mentions, list)  # Should return list even if empty
 
 
-def test_macos13_note_content_extraction(macos13_db_connection):
+def test_macos13_note_content_extraction(macos_loaded):
     """Test that note content is properly extracted and not null."""
-    accounts = macos13_db_connection.get_accounts()
-    accounts_dict = {acc.id: acc for acc in accounts}
-    folders = macos13_db_connection.get_folders(accounts_dict)
-    folders_dict = {f.id: f for f in folders}
-    notes = macos13_db_connection.get_notes(accounts_dict, folders_dict)
+    notes = macos_loaded.notes
 
     # At least some notes should have non-null content
     notes_with_content = [note for note in notes if note.content]
@@ -400,7 +388,7 @@ def test_macos13_note_content_extraction(macos13_db_connection):
     )
 
     # Check specific notes we know should have content
-    notes_by_title = {note.title: note for note in notes}
+    notes_by_title = macos_loaded.notes_by_title
 
     simple_note = notes_by_title.get("This is a note")
     if simple_note:
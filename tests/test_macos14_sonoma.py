@@ -14,6 +14,12 @@ from apple_notes_parser import AppleNotesParser
 from apple_notes_parser.database import AppleNotesDatabase
 
 
+@pytest.fixture
+def macos_database(macos_14_database):
+    """Fixture selecting the macOS 14 database for macos_loaded."""
+    return macos_14_database
+
+
 @pytest.fixture
 def macos14_db_connection(macos_14_database):
     """Fixture providing a connected AppleNotesDatabase instance for macOS 14."""
@@ -33,29 +39,25 @@ def test_macos14_z_uuid_extraction(macos14_db_connection):
     assert z_uuid == "96FBBB9A-C1A9-4216-ACA4-1BE22EC8E9B4"
 
 
-def test_macos14_basic_data_extraction(macos14_db_connection):
+def test_macos14_basic_data_extraction(macos_loaded):
     """Test basic data extraction from macOS 14 database."""
     # Test accounts
-    accounts = macos14_db_connection.get_accounts()
+    accounts = macos_loaded.accounts
     assert len(accounts) == 1
     assert accounts[0].name == "On My Mac"
 
     # Test folders
-    accounts_dict = {acc.id: acc for acc in accounts}
-    folders = macos14_db_connection.get_folders(accounts_dict)
+    folders = macos_loaded.folders
     assert len(folders) == 6
 
     # Test notes
-    folders_dict = {f.id: f for f in folders}
-    notes = macos14_db_connection.get_notes(accounts_dict, folders_dict)
+    notes = macos_loaded.notes
     assert len(notes) == 8
 
 
-def test_macos14_folder_structure(macos14_db_connection):
+def test_macos14_folder_structure(macos_loaded):
     """Test folder hierarchy in macOS 14 database."""
-    accounts = macos14_db_connection.get_accounts()
-    accounts_dict = {acc.id: acc for acc in accounts}
-    folders = macos14_db_connection.get_folders(accounts_dict)
+    folders = macos_loaded.folders
 
     # Verify expected folders exist
     folder_names = {f.name for f in folders}
@@ -88,16 +90,10 @@ def test_macos14_folder_structure(macos14_db_connection):
     assert subsubfolder.get_parent().name == "Subfolder"
 
 
-def test_macos14_notes_content(macos14_db_connection):
+def test_macos14_notes_content(macos_loaded):
     """Test note content extraction from macOS 14 database."""
-    accounts = macos14_db_connection.get_accounts()
-    accounts_dict = {acc.id: acc for acc in accounts}
-    folders = macos14_db_connection.get_folders(accounts_dict)
-    folders_dict = {f.id: f for f in folders}
-    notes = macos14_db_connection.get_notes(accounts_dict, folders_dict)
-
     # Find specific notes by title
-    notes_by_title = {n.title: n for n in notes if n.title}
+    notes_by_title = macos_loaded.notes_by_title
 
     # Test password protected note
     protected_note = notes_by_title.get("This note is password protected")
@@ -137,13 +133,9 @@ def test_macos14_notes_content(macos14_db_connection):
     assert plain_note.folder.name == "Notes"
 
 
-def test_macos14_applescript_ids(macos14_db_connection):
+def test_macos14_applescript_ids(macos_loaded):
     """Test AppleScript ID construction for macOS 14 database."""
-    accounts = macos14_db_connection.get_accounts()
-    accounts_dict = {acc.id: acc for acc in accounts}
-    folders = macos14_db_connection.get_folders(accounts_dict)
-    folders_dict = {f.id: f for f in folders}
-    notes = macos14_db_connection.get_notes(accounts_dict, folders_dict)
+    notes = macos_loaded.notes
 
     # All notes should have AppleScript IDs
     for note in notes:
@@ -153,7 +145,7 @@ def test_macos14_applescript_ids(macos14_db_connection):
         assert "96FBBB9A-C1A9-4216-ACA4-1BE22EC8E9B4" in note.applescript_id
 
     # Test specific AppleScript IDs match expected pattern
-    notes_by_title = {n.title: n for n in notes if n.title}
+    notes_by_title = macos_loaded.notes_by_title
     plain_note = notes_by_title.get("This is a plain note")
     assert plain_note is not None
     assert (
@@ -203,11 +195,8 @@ def test_macos14_deleted_notes_support(macos_14_database):
     parser = AppleNotesParser(macos_14_database)
 
     # Find the recently deleted folder
-    recently_deleted_folder = None
-    for folder in parser.folders:
-        if folder.name == "Recently Deleted":
-            recently_deleted_folder = folder
-            break
+    folders_by_name = {f.name: f for f in parser.folders}
+    recently_deleted_folder = folders_by_name.get("Recently Deleted")
 
     assert recently_deleted_folder is not None, (
         "Recently Deleted folder should exist in macOS 14"
@@ -215,7 +204,7 @@ def test_macos14_deleted_notes_support(macos_14_database):
 
     # Find notes in recently deleted folder
     deleted_notes = [
-        note for note in parser.notes if note.folder.name == "Recently Deleted"
+        note for note in parser.notes if note.folder is recently_deleted_folder
     ]
     assert len(deleted_notes) >= 1, "Should have at least one deleted note"
 
@@ -389,24 +378,16 @@ def test_macos14_version_specific_features(macos_14_database):
     assert len(attachment_notes) == 1
 
 
-def test_macos14_attachment_extraction(macos14_db_connection):
+def test_macos14_attachment_extraction(macos_loaded):
     """Test attachment extraction capabilities in macOS 14."""
-    accounts = macos14_db_connection.get_accounts()
-    accounts_dict = {acc.id: acc for acc in accounts}
-    folders = macos14_db_connection.get_folders(accounts_dict)
-    folders_dict = {f.id: f for f in folders}
-    notes = macos14_db_connection.get_notes(accounts_dict, folders_dict)
+    notes = macos_loaded.notes
 
     # Find notes with attachments
     notes_with_attachments = [note for note in notes if note.attachments]
     assert len(notes_with_attachments) >= 1
 
     # Test the specific attachment note
-    attachment_note = None
-    for note in notes:
-        if note.title == "This note has an attachment":
-            attachment_note = note
-            break
+    attachment_note = macos_loaded.notes_by_title.get("This note has an attachment")
 
     assert attachment_note is not None
     assert len(attachment_note.attachments) >= 1
@@ -417,13 +398,9 @@ def test_macos14_attachment_extraction(macos14_db_connection):
     assert attachment.uuid is not None
 
 
-def test_macos14_note_content_extraction(macos14_db_connection):
+def test_macos14_note_content_extraction(macos_loaded):
     """Test that note content is properly extracted and not null."""
-    accounts = macos14_db_connection.get_accounts()
-    accounts_dict = {acc.id: acc for acc in accounts}
-    folders = macos14_db_connection.get_folders(accounts_dict)
-    folders_dict = {f.id: f for f in folders}
-    notes = macos14_db_connection.get_notes(accounts_dict, folders_dict)
+    notes = macos_loaded.notes
 
     # At least some notes should have non-null content
     notes_with_content = [note for note in notes if note.content]
@@ -432,7 +409,7 @@ def test_macos14_note_content_extraction(macos14_db_connection):
     )
 
     # Check specific notes we know should have content
-    notes_by_title = {note.title: note for note in notes}
+    notes_by_title = macos_loaded.notes_by_title
 
     plain_note = notes_by_title.get("This is a plain note")
     if plain_note:
@@ -0,0 +1,70 @@
+"""
+Tests for the text extractors in ProtobufParser.
+
+The extractors return unique matches in order of first appearance, so results
+are compared as lists.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from apple_notes_parser.protobuf_parser import ProtobufParser
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("", []),
+        ("No tags here", []),
+        ("Trip #travel #vacation", ["travel", "vacation"]),
+        ("#vacation before #travel", ["vacation", "travel"]),
+        ("#travel again #travel", ["travel"]),
+        ("#tag1, #tag_2! and #ünïcode", ["tag1", "tag_2", "ünïcode"]),
+        ("Not a tag: # alone", []),
+    ],
+)
+def test_hashtag_extraction(text, expected):
+    """Test hashtag extraction from note text."""
+    assert ProtobufParser.extract_hashtags(text) == expected
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("", []),
+        ("No mentions here", []),
+        ("Ask @alice and @bob_2", ["alice", "bob_2"]),
+        ("@alice, then @alice again", ["alice"]),
+        ("@bob then @alice then @bob", ["bob", "alice"]),
+    ],
+)
+def test_mention_extraction(text, expected):
+    """Test @mention extraction from note text."""
+    assert ProtobufParser.extract_mentions(text) == expected
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("", []),
+        ("No links here", []),
+        ("Visit https://example.com today", ["https://example.com"]),
+        ("See https://example.com/path?x=1.", ["https://example.com/path?x=1"]),
+        ("(http://foo.org/a)", ["http://foo.org/a"]),
+        ("<https://a.b/c>", ["https://a.b/c"]),
+        ("https://x.y/z, https://x.y/z", ["https://x.y/z"]),
+        (
+            "https://b.example then https://a.example",
+            ["https://b.example", "https://a.example"],
+        ),
+        ("ftp://example.com is not matched", []),
+    ],
+)
+def test_link_extraction(text, expected):
+    """Test URL extraction from note text."""
+    assert ProtobufParser.extract_links(text) == expected
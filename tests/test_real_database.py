@@ -2,6 +2,9 @@
 Tests using the real macOS 15 NoteStore database.
 """
 
+import dataclasses
+import io
+import json
 import sys
 from pathlib import Path
 
@@ -38,16 +41,12 @@ def test_accounts_extraction(database_with_connection, database_metadata):
 
 
 def test_folders_extraction_and_hierarchy(
-    database_with_connection, sample_folders_data
+    folders_list, folders_by_name, sample_folders_data
 ):
     """Test extraction of folders and their hierarchy."""
-    accounts_list = database_with_connection.get_accounts()
-    accounts_dict = {acc.id: acc for acc in accounts_list}
-    folders_list = database_with_connection.get_folders(accounts_dict)
     assert len(folders_list) == sample_folders_data["total_count"]
 
     # Verify specific folder hierarchy
-    folders_by_name = {f.name: f for f in folders_list}
 
     for expected in sample_folders_data["expected_folders"]:
         folder = folders_by_name.get(expected["name"])
@@ -254,9 +253,9 @@ def test_parser_data_loading(test_database, database_metadata):
     assert len(parser.notes) == database_metadata["total_notes"]
 
 
-def test_tag_functionality(test_database, sample_notes_data):
+def test_tag_functionality(loaded_parser, sample_notes_data):
     """Test tag extraction and search functionality."""
-    parser = AppleNotesParser(test_database)
+    parser = loaded_parser
 
     # Get all tags
     all_tags = parser.get_all_tags()
@@ -273,9 +272,47 @@ def test_tag_functionality(test_database, sample_notes_data):
             assert isinstance(notes_with_tag, list)
 
 
-def test_password_protection_detection(test_database):
-    """Test detection of password-protected notes."""
+def test_tag_queries_match_note_scan(loaded_parser, sample_notes_data):
+    """Test that indexed tag queries match a scan over every note."""
+    parser = loaded_parser
+    tags = sample_notes_data["tagged_note"]["tags"]
+    queries = [[tags[0].upper()], tags, [tags[0], "no-such-tag"], []]
+
+    for tag in [*tags, tags[0].upper(), "no-such-tag"]:
+        expected = [note for note in parser.notes if note.has_tag(tag)]
+        assert parser.get_notes_by_tag(tag) == expected
+
+    for query in queries:
+        any_expected = [
+            note for note in parser.notes if any(note.has_tag(t) for t in query)
+        ]
+        all_expected = [
+            note for note in parser.notes if all(note.has_tag(t) for t in query)
+        ]
+        assert parser.get_notes_by_tags(query) == any_expected
+        assert parser.get_notes_by_tags(query, match_all=True) == all_expected
+
+    assert parser.get_notes_by_tag(tags[0])
+
+
+def test_tag_index_is_built_by_load_data(test_database):
+    """Test that tag queries reflect tags as of the last load_data() call."""
     parser = AppleNotesParser(test_database)
+    note = parser.notes[0]
+    note.tags.append("added-later")
+    assert note.has_tag("added-later")
+    assert parser.get_notes_by_tag("added-later") == []
+
+    parser.load_data()
+    assert parser.get_notes_by_tag("added-later") == []
+    for note in parser.notes:
+        for tag in note.tags:
+            assert note in parser.get_notes_by_tag(tag)
+
+
+def test_password_protection_detection(loaded_parser):
+    """Test detection of password-protected notes."""
+    parser = loaded_parser
 
     protected_notes = parser.get_protected_notes()
     assert isinstance(protected_notes, list)
@@ -288,9 +325,9 @@ def test_password_protection_detection(test_database):
     assert "This note is password protected" in protected_titles
 
 
-def test_search_functionality(test_database):
+def test_search_functionality(loaded_parser):
     """Test note search functionality."""
-    parser = AppleNotesParser(test_database)
+    parser = loaded_parser
 
     # Search for specific text that should exist
     results = parser.search_notes("subfolder")
@@ -305,9 +342,9 @@ def test_search_functionality(test_database):
     assert len(results_title) >= 1
 
 
-def test_export_functionality(test_database):
+def test_export_functionality(loaded_parser):
     """Test data export functionality."""
-    parser = AppleNotesParser(test_database)
+    parser = loaded_parser
 
     export_data = parser.export_notes_to_dict(include_content=True)
 
@@ -331,9 +368,51 @@ def test_export_functionality(test_database):
         assert "09FBEB4A-5B24-424E-814B-4AE8E757FB83" in note_data["applescript_id"]
 
 
-def test_attachment_functionality(test_database, sample_notes_data):
+def test_export_without_content(loaded_parser):
+    """Test that excluding content only blanks the content field."""
+    full_export = loaded_parser.export_notes_to_dict(include_content=True)
+    assert any(note_data["content"] for note_data in full_export["notes"])
+
+    stripped_export = loaded_parser.export_notes_to_dict(include_content=False)
+    assert stripped_export["accounts"] == full_export["accounts"]
+    assert stripped_export["folders"] == full_export["folders"]
+    assert stripped_export["notes"] == [
+        {**note_data, "content": None} for note_data in full_export["notes"]
+    ]
+
+
+def test_export_to_json_matches_dict(loaded_parser):
+    """Test that the streaming JSON export matches dumping the export dict."""
+    subset = loaded_parser.notes[:2]
+    # Line and paragraph separators inside strings must survive indentation
+    separators = [
+        dataclasses.replace(loaded_parser.notes[0], content="a\u2028b\u2029c\x85d\ne")
+    ]
+    for kwargs in (
+        {},
+        {"include_content": False},
+        {"notes": subset},
+        {"notes": []},
+        {"notes": separators},
+    ):
+        output = io.StringIO()
+        loaded_parser.export_notes_to_json(output, **kwargs)
+        expected = json.dumps(
+            loaded_parser.export_notes_to_dict(**kwargs), indent=2, ensure_ascii=False
+        )
+        assert output.getvalue() == expected
+
+    output = io.StringIO()
+    loaded_parser.export_notes_to_json(output, compact=True)
+    expected = json.dumps(
+        loaded_parser.export_notes_to_dict(), ensure_ascii=False, separators=(",", ":")
+    )
+    assert output.getvalue() == expected
+
+
+def test_attachment_functionality(loaded_parser, sample_notes_data):
     """Test attachment extraction and search functionality."""
-    parser = AppleNotesParser(test_database)
+    parser = loaded_parser
 
     # Test notes with attachments
     notes_with_attachments = parser.get_notes_with_attachments()
@@ -391,18 +470,21 @@ def test_attachment_functionality(test_database, sample_notes_data):
     assert not pdf_attachment.is_audio
 
 
-def test_attachment_export(test_database):
+def test_attachment_export(loaded_parser):
     """Test that attachments are included in export data."""
-    parser = AppleNotesParser(test_database)
+    parser = loaded_parser
 
     export_data = parser.export_notes_to_dict(include_content=True)
 
     # Find note with attachment in export data
-    attachment_note_data = None
-    for note_data in export_data["notes"]:
-        if note_data["title"] == "This note has an attachment":
-            attachment_note_data = note_data
-            break
+    attachment_note_data = next(
+        (
+            note_data
+            for note_data in export_data["notes"]
+            if note_data["title"] == "This note has an attachment"
+        ),
+        None,
+    )
 
     assert attachment_note_data is not None, "Should find attachment note in export"
     assert "attachments" in attachment_note_data, (
@@ -445,9 +527,9 @@ def test_attachment_export(test_database):
     assert first_attachment["is_image"] is False
 
 
-def test_get_note_by_applescript_id(test_database, sample_notes_data):
+def test_get_note_by_applescript_id(loaded_parser, sample_notes_data):
     """Test getting a note by its AppleScript ID."""
-    parser = AppleNotesParser(test_database)
+    parser = loaded_parser
 
     # Test with a known AppleScript ID from sample data
     expected_applescript_id = sample_notes_data["tagged_note"]["applescript_id"]